@@ -3,50 +3,169 @@
 Generate index.html from DW Alltagsdeutsch RSS feed
 """
 
-import xml.etree.ElementTree as ET
-import html
+try:
+    from lxml import etree as ET
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from datetime import datetime
-from urllib.request import urlopen
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape
 import re
 import os
 from urllib.parse import urlparse, parse_qs
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 from mistralai import Mistral
+import httpx
 import json
 import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+from collections import defaultdict, deque
 import hashlib
-import pickle
 
 RSS_FEED_URL = "https://rss.dw.com/xml/DKpodcast_alltagsdeutsch_de"
 OUTPUT_FILE = "index.html"
 MANUSCRIPTS_DIR = "manuscripts"
 CACHE_DIR = "mistral_cache"
+FEED_STATE_FILE = ".rss_cache.json"
 MAX_EPISODES = 10
 
+# Pooled HTTP client shared by all plain HTTP requests; it sends
+# Accept-Encoding and decompresses gzip/deflate responses transparently.
+# A browser User-Agent avoids 403 errors
+HTTP_CLIENT = httpx.Client(
+    headers={'User-Agent': 'Mozilla/5.0'},
+    follow_redirects=True,
+    timeout=30,
+)
+
+# Chromium flags for headless scraping, and resource types the scraper never reads
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-default-apps',
+    '--no-first-run',
+    '--mute-audio',
+    '--blink-settings=imagesEnabled=false',
+]
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+# Analytics and ad hosts, whose scripts and beacons are never needed either
+BLOCKED_URL_PATTERN = re.compile(r'google-analytics\.com|googletagmanager\.com|doubleclick\.net')
+# Maximum number of manuscript pages loaded at the same time, in the browser
+# and over plain HTTP
+MAX_CONCURRENT_FETCHES = 4
+MAX_CONCURRENT_STATIC_FETCHES = 8
+# Maximum number of episodes rendered (and translated) at the same time
+MAX_CONCURRENT_EPISODES = 4
+NSMAP = {'itunes': 'http://www.itunes.com/dtds/podcast-1.0.dtd'}
+
+# Prefixed tags resolved to Clark notation once, so lookups need no namespace map
+_ITUNES_NS = '{' + NSMAP['itunes'] + '}'
+_RESOLVED_TAGS = {
+    'itunes:duration': _ITUNES_NS + 'duration',
+    'itunes:summary': _ITUNES_NS + 'summary',
+}
+
+if LXML_AVAILABLE:
+    # Compiled XPath evaluators for the item fields read on every episode;
+    # string() returns '' for missing elements
+    _TEXT_XPATHS = {
+        tag: ET.XPath(f'string({tag})', namespaces=NSMAP, smart_strings=False)
+        for tag in ('title', 'pubDate', 'description', 'link',
+                    'itunes:summary', 'itunes:duration')
+    }
+    _ENCLOSURE_URL_XPATH = ET.XPath('string(enclosure/@url)', smart_strings=False)
+    # Same elements as the div.richtext-content-container and
+    # [data-testid="poster-container"] selectors used in the browser
+    _MANUSCRIPT_SECTIONS_XPATH = ET.XPath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " richtext-content-container ")]')
+    _POSTER_STYLE_XPATH = ET.XPath(
+        'string((//*[@data-testid="poster-container"])[1]/@style)', smart_strings=False)
+else:
+    _TEXT_XPATHS = {}
+
+_MONTHS_DE = ('', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+              'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember')
+
+# Words, as counted and wrapped in clickable spans
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Tags that separate the paragraphs translated independently
+_PARAGRAPH_SPLIT_RE = re.compile(r'(<p>|</p>|<br\s*/?>|<strong>|</strong>)', re.IGNORECASE)
+
+# Tokenizer used by make_words_clickable, in a single pass: an HTML tag, whitespace,
+# a word followed only by punctuation up to the next whitespace or tag, or other text
+_CLICKABLE_TOKEN_RE = re.compile(r"""
+    (?P<tag><[^>]+>)
+  | (?P<space>\s+)
+  | (?P<word>\w+)(?P<punct>(?:(?!<[^>]+>)[^\w\s])*)(?=\s|<[^>]+>|\Z)
+  | (?:(?!<[^>]+>)\S)+
+""", re.VERBOSE)
+
+# DW lesson ID in an episode link, and illustration URL in a poster style attribute
+_LESSON_ID_RE = re.compile(r'/l-(\d+)')
+_BACKGROUND_URL_RE = re.compile(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)')
+
+# data-word-id attributes set by wrap_words_in_spans, with their quote and index
+_WORD_ID_RE = re.compile(r"""data-word-id=(['"])(\d+)\1""")
+
+# Same replacements as html.escape(), applied in a single str.translate pass
+_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+# Replacements for text nodes, where quotes are left as is (like innerHTML)
+_TEXT_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+})
+
+# KEY=VALUE lines of a .env file; values may be double or single quoted, and
+# unquoted values end at an inline comment
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\r\n]*)"|\'([^\'\r\n]*)\'|([^\r\n#]*))',
+    re.MULTILINE
+)
+
 # Load environment variables from .env file if present
 def load_env_file():
     """Load environment variables from .env file if it exists"""
     env_file = os.path.join(os.path.dirname(__file__), '.env')
-    if os.path.exists(env_file):
+    try:
         with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                # Parse KEY=VALUE
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    # Only set if not already in environment
-                    if key not in os.environ:
-                        os.environ[key] = value
+            data = f.read()
+    except FileNotFoundError:
+        return
+    for match in _ENV_LINE_RE.finditer(data):
+        key, double_quoted, single_quoted, unquoted = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = unquoted.strip()
+        # Only set if not already in environment
+        os.environ.setdefault(key, value)
 
 # Load .env file before reading environment variables
 load_env_file()
@@ -54,6 +173,16 @@ load_env_file()
 # Mistral API configuration
 MISTRAL_API_KEY = os.environ.get('MISTRAL_API_KEY')
 MISTRAL_MODEL = "open-mistral-nemo-2407"
+# Maximum number of Mistral requests in flight at the same time, to respect rate limits
+# The semaphore enforces it across all episodes and paragraph batches
+MISTRAL_MAX_CONCURRENCY = 5
+MISTRAL_SEMAPHORE = threading.BoundedSemaphore(MISTRAL_MAX_CONCURRENCY)
+# Number of paragraphs sent in a single Mistral request
+MISTRAL_BATCH_SIZE = 6
+# Paragraphs with fewer words (speaker labels, interjections) are not sent to the API
+MIN_PARAGRAPH_WORDS = 4
+# Shared client, so all requests reuse its pool of keep-alive connections
+MISTRAL_CLIENT = Mistral(api_key=MISTRAL_API_KEY) if MISTRAL_API_KEY else None
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="de">
@@ -603,7 +732,21 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
-EPISODE_CARD_TEMPLATE = """        <div class="episode-card" onclick="showEpisodeDetail({number})">
+# HTML_TEMPLATE split once at import into its static chunks (with the doubled
+# braces unescaped), so rendering the page is a plain join instead of a
+# str.format pass over the whole template
+_PAGE_HEAD, _PAGE_BEFORE_EPISODES, _PAGE_BEFORE_DETAILS, _PAGE_TAIL = [
+    chunk.replace('{{', '{').replace('}}', '}')
+    for chunk in re.split(r'\{(?:word_translations_data|episodes|episode_details)\}', HTML_TEMPLATE)
+]
+
+def render_episode_card(number, date, title, description, illustration_url=None):
+    """Render an episode card for the list view, with a smaller illustration if any"""
+    illustration = (
+        f'<img src="{illustration_url}" alt="{title}" class="episode-illustration-card" style="width: 100%; border-radius: 8px; margin-bottom: 0.75rem;">'
+        if illustration_url else ''
+    )
+    return f"""        <div class="episode-card" onclick="showEpisodeDetail({number})">
             {illustration}
             <div class="episode-header">
                 <span class="episode-number">{number}</span>
@@ -615,7 +758,15 @@ EPISODE_CARD_TEMPLATE = """        <div class="episode-card" onclick="showEpisod
         </div>
 """
 
-EPISODE_DETAIL_TEMPLATE = """    <div class="episode-detail" id="episode-detail-{number}">
+
+def render_episode_detail(number, title, date, duration, audio_url, description, illustration_url,
+                          transcript_section):
+    """Render the detail view of an episode, with a full size illustration if any"""
+    illustration = (
+        f'<img src="{illustration_url}" alt="{title}" class="episode-illustration" style="width: 100%; border-radius: 10px; margin-bottom: 1.5rem;">'
+        if illustration_url else ''
+    )
+    return f"""    <div class="episode-detail" id="episode-detail-{number}">
         <div class="detail-content">
             {illustration}
             <h2 class="detail-title">{title}</h2>
@@ -637,7 +788,10 @@ EPISODE_DETAIL_TEMPLATE = """    <div class="episode-detail" id="episode-detail-
     </div>
 """
 
-TRANSCRIPT_SECTION_TEMPLATE = """            <div class="transcript-section">
+
+def render_transcript_section(number, manuscript_content):
+    """Render the collapsible manuscript section of an episode detail view"""
+    return f"""            <div class="transcript-section">
                 <button class="transcript-toggle" onclick="toggleTranscript({number})">
                     <span>Manuskript</span>
                     <span class="toggle-icon" id="toggle-icon-{number}">▼</span>
@@ -649,99 +803,125 @@ TRANSCRIPT_SECTION_TEMPLATE = """            <div class="transcript-section">
 """
 
 
+@lru_cache(maxsize=64)
 def format_duration(duration_str):
     """Format duration string to readable format"""
     if not duration_str:
         return ""
 
+    # Feed text is already str; only coerce other input types
+    s = duration_str if type(duration_str) is str else str(duration_str)
     try:
         # Handle different duration formats (HH:MM:SS, MM:SS, or seconds)
-        if ':' in str(duration_str):
-            parts = str(duration_str).split(':')
-            if len(parts) == 3:  # HH:MM:SS
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = int(parts[2])
-                if hours > 0:
-                    return f"{hours}:{minutes:02d}:{seconds:02d}"
-                else:
-                    return f"{minutes}:{seconds:02d}"
-            elif len(parts) == 2:  # MM:SS
+        if ':' in s:
+            parts = s.split(':')
+            if len(parts) == 2:  # MM:SS
                 return duration_str
-        else:
-            # Assume seconds
-            seconds = int(duration_str)
-            minutes = seconds // 60
-            secs = seconds % 60
-            return f"{minutes}:{secs:02d}"
+            if len(parts) != 3:
+                return ""
+            hours, minutes, seconds = map(int, parts)
+            return f"{hours}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes}:{seconds:02d}"
+        # Assume seconds
+        seconds = int(s)
+        return f"{seconds // 60}:{seconds % 60:02d}"
     except (ValueError, TypeError):
         return duration_str
 
-    return ""
 
-
-def strip_html_tags(text):
-    """Remove HTML tags from text"""
+@lru_cache(maxsize=64)
+def format_pub_date(pub_date):
+    """Format an RSS pubDate as a German date (e.g. "15. Januar 2024")"""
+    try:
+        # Parse RFC 822 date format (e.g., "Mon, 15 Jan 2024 12:00:00 +0000"),
+        # trying the fixed format used by the DW feed first
+        try:
+            dt = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
+        except ValueError:
+            dt = parsedate_to_datetime(pub_date)
+        # Format to German date
+        return f"{dt.day}. {_MONTHS_DE[dt.month]} {dt.year}"
+    except (TypeError, ValueError):
+        return pub_date
+
+
+def iter_text_chunks(text):
+    """Yield the text between HTML tags, scanning forward once (no regex backtracking)"""
+    i = 0
+    n = len(text)
+    while i < n:
+        j = text.find('<', i)
+        if j < 0:
+            yield text[i:]
+            return
+        yield text[i:j]
+        k = text.find('>', j + 1)
+        if k < 0:
+            # Unterminated tag: keep the remainder as text
+            yield text[j:]
+            return
+        i = k + 1
+
+
+def clean_description(text, limit=None):
+    """
+    Strip HTML tags, decode entities and escape text for HTML output in a single scan
+    Entities are decoded before escaping, so they are not escaped twice
+    The result is only used as element content, so quotes are not escaped
+    If limit is given, text longer than limit characters is truncated at a word
+    boundary with "…", and the scan stops as soon as the limit is exceeded
+    """
     if not text:
         return ""
-    # Remove HTML tags
-    clean = re.sub('<.*?>', '', text)
-    return clean.strip()
 
+    parts = []
+    length = 0
+    for chunk in iter_text_chunks(text):
+        parts.append(chunk)
+        length += len(chunk)
+        if limit is not None and length > limit:
+            plain = unescape(''.join(parts)).strip()
+            if len(plain) > limit:
+                # Keep limit - 1 characters for the ellipsis, without splitting a word
+                kept = plain[:limit - 1]
+                if not plain[limit - 1].isspace():
+                    kept = kept.rsplit(None, 1)[0]
+                return escape_html(kept.rstrip(), quote=False) + "…"
 
-def get_cache_key(prompt):
-    """Generate MD5 hash for cache key"""
-    return hashlib.md5(prompt.encode('utf-8')).hexdigest()
+    return escape_html(unescape(''.join(parts)).strip(), quote=False)
 
 
-def get_from_cache(cache_key):
-    """Retrieve result from cache if it exists"""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+def escape_html(text, quote=True):
+    """Escape HTML special characters (equivalent to html.escape)"""
+    return text.translate(_ESCAPE_TABLE if quote else _TEXT_ESCAPE_TABLE)
 
-    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.pkl")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
-        except Exception as e:
-            print(f"  ⚠ Error loading cache: {e}")
-            return None
-    return None
 
+def json_loads(data):
+    """Parse JSON from str or UTF-8 bytes, with orjson if available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def save_to_cache(cache_key, result):
-    """Save result to cache"""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
 
-    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.pkl")
-    try:
-        with open(cache_file, 'wb') as f:
-            pickle.dump(result, f)
-    except Exception as e:
-        print(f"  ⚠ Error saving cache: {e}")
+def json_dumps(obj):
+    """Serialize obj to UTF-8 JSON bytes, with orjson if available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 
-def translate_paragraph_with_mistral(paragraph_text, context="", max_retries=3):
+def get_cache_key(paragraph_text, num_difficult_words, model):
     """
-    Translate difficult words in a paragraph and return HTML with clickable spans
-    Returns a tuple: (html_with_spans, word_translations_list)
+    Generate cache key from the inputs that determine a paragraph translation, so
+    entries survive changes to the prompt wording
     """
-    if not MISTRAL_API_KEY:
-        return paragraph_text, []
-
-    # Extract words while preserving order
-    words = re.findall(r'\b\w+\b', paragraph_text)
-    if not words:
-        return paragraph_text, []
+    key = f"{paragraph_text}|{num_difficult_words}|{model}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
 
-    # Calculate how many difficult words to translate (1/3 of total)
-    num_difficult_words = max(1, len(words) // 3)
 
-    client = Mistral(api_key=MISTRAL_API_KEY)
-
-    # Prepare the prompt - simpler approach, just get the words to translate
+def get_legacy_cache_key(paragraph_text, num_difficult_words, context=""):
+    """
+    Generate MD5 hash of the full single-paragraph prompt, the cache key of older entries
+    """
     prompt = f"""Tu es un assistant de traduction allemand-français spécialisé dans l'analyse grammaticale.
 
 Contexte global : {context if context else "Texte général en allemand"}
@@ -767,276 +947,464 @@ RÈGLES:
 - Sélectionne EXACTEMENT {num_difficult_words} mots les plus difficiles
 - Le champ "word" doit contenir le mot EXACT du texte (même capitalisation)
 - Évite les mots faciles (der, die, das, und, aber, ist, hat, etc.)"""
+    return hashlib.md5(prompt.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=2048)
+def load_cached_translation(cache_key):
+    """
+    Read a cache entry from disk, memoized for the rest of the run
+    Returns the translations as a tuple; raises FileNotFoundError if the entry does not
+    exist, so misses are not memoized
+    """
+    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.json")
+    with open(cache_file, 'rb') as f:
+        return tuple(json_loads(f.read()))
+
+
+def get_from_cache(cache_key):
+    """Retrieve result from cache if it exists"""
+    try:
+        return load_cached_translation(cache_key)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"  ⚠ Error loading cache: {e}")
+        return None
+
 
-    # Check cache first
-    cache_key = get_cache_key(prompt)
+def save_to_cache(cache_key, result):
+    """Save result to cache, atomically"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.json")
+    # Per-thread temporary file, as episodes sharing a paragraph may save it concurrently
+    tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(json_dumps(result))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"  ⚠ Error saving cache: {e}")
+
+
+def count_difficult_words(paragraph_text):
+    """
+    Number of difficult words to translate in a paragraph (1/3 of its words)
+    Returns 0 for paragraphs shorter than MIN_PARAGRAPH_WORDS, which are not translated
+    """
+    words = _WORD_RE.findall(paragraph_text)
+    if len(words) < MIN_PARAGRAPH_WORDS:
+        return 0
+    return max(1, len(words) // 3)
+
+
+def get_cached_paragraph_translation(paragraph_text, num_difficult_words, context=""):
+    """
+    Retrieve the translations of a paragraph from cache
+    Entries cached under the former full prompt key are moved to the current key
+    Returns the translations or None if the paragraph is not cached
+    """
+    cache_key = get_cache_key(paragraph_text, num_difficult_words, MISTRAL_MODEL)
     cached_result = get_from_cache(cache_key)
     if cached_result:
-        print(f"    ✓ Using cached translation")
-        html_with_spans = wrap_words_in_spans(paragraph_text, cached_result)
-        return html_with_spans, cached_result
+        return cached_result
+
+    cached_result = get_from_cache(get_legacy_cache_key(paragraph_text, num_difficult_words, context))
+    if cached_result:
+        save_to_cache(cache_key, cached_result)
+    return cached_result
+
+
+def translate_paragraphs_with_mistral(paragraphs, context="", max_retries=3):
+    """
+    Find and translate difficult words of several paragraphs with a single Mistral request
+    paragraphs is a list of (paragraph_text, num_difficult_words) pairs
+    Paragraphs missing from a response are requested again on the next attempt
+    Returns a dict mapping each translated paragraph text to its translations list
+    """
+    results = {}
+    pending = dict(enumerate(paragraphs))
 
     for attempt in range(max_retries):
+        paragraphs_json = json.dumps([
+            {"id": paragraph_id, "text": paragraph_text, "count": num_difficult_words}
+            for paragraph_id, (paragraph_text, num_difficult_words) in pending.items()
+        ], ensure_ascii=False)
+
+        prompt = f"""Tu es un assistant de traduction allemand-français spécialisé dans l'analyse grammaticale.
+
+Contexte global : {context if context else "Texte général en allemand"}
+
+Paragraphes à analyser (JSON) :
+{paragraphs_json}
+
+TÂCHE:
+Pour chaque paragraphe, identifie les "count" mots les plus DIFFICILES pour un apprenant de l'allemand (vocabulaire avancé, structures grammaticales complexes, expressions idiomatiques) et fournis pour chacun:
+- Le mot exact tel qu'il apparaît dans le paragraphe
+- Ses informations grammaticales
+- Sa traduction française en contexte
+
+Format de réponse JSON OBLIGATOIRE :
+{{
+  "results": [
+    {{"id": 0, "translations": [
+      {{"word": "mot_exact_1", "grammar": "informations grammaticales", "translation": "traduction en contexte"}},
+      {{"word": "mot_exact_2", "grammar": "informations grammaticales", "translation": "traduction en contexte"}}
+    ]}}
+  ]
+}}
+
+RÈGLES:
+- Réponds pour CHAQUE paragraphe, avec son "id"
+- Sélectionne EXACTEMENT "count" mots parmi les plus difficiles de chaque paragraphe
+- Le champ "word" doit contenir le mot EXACT du paragraphe (même capitalisation)
+- Évite les mots faciles (der, die, das, und, aber, ist, hat, etc.)"""
+
         try:
-            response = client.chat.complete(
-                model=MISTRAL_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0,
-                timeout_ms=60000
-            )
-
-            result = json.loads(response.choices[0].message.content)
-
-            if "translations" in result and isinstance(result["translations"], list) and len(result["translations"]) > 0:
-                # Save to cache
-                save_to_cache(cache_key, result["translations"])
-
-                # Wrap difficult words in spans
-                html_with_spans = wrap_words_in_spans(paragraph_text, result["translations"])
-                return html_with_spans, result["translations"]
-            else:
-                print(f"  ⚠ Invalid response format (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(2)
-                continue
+            with MISTRAL_SEMAPHORE:
+                response = MISTRAL_CLIENT.chat.complete(
+                    model=MISTRAL_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"},
+                    temperature=0,
+                    timeout_ms=60000
+                )
+
+            result = json_loads(response.choices[0].message.content)
+
+            for entry in result.get("results", []):
+                try:
+                    paragraph_id = int(entry["id"])
+                    translations = entry["translations"]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if paragraph_id not in pending or not isinstance(translations, list) or not translations:
+                    continue
+                if not all(isinstance(t, dict) and "word" in t for t in translations):
+                    continue
+
+                # Save to cache, per paragraph
+                paragraph_text, num_difficult_words = pending.pop(paragraph_id)
+                save_to_cache(get_cache_key(paragraph_text, num_difficult_words, MISTRAL_MODEL), translations)
+                results[paragraph_text] = translations
+
+            if not pending:
+                return results
+            print(f"  ⚠ Invalid response format for {len(pending)} paragraphs (attempt {attempt + 1}/{max_retries})")
 
         except Exception as e:
             print(f"  ⚠ Error on attempt {attempt + 1}/{max_retries}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
-                continue
-            else:
-                return paragraph_text, []
 
-    return paragraph_text, []
+        if attempt < max_retries - 1:
+            time.sleep(2)
+
+    return results
 
 
 def wrap_words_in_spans(text, translations):
     """
     Wrap words from translations list in span tags
     """
-    # Build a list of words to wrap with their translation index
-    # Handle duplicate words by tracking which occurrence we're on
-    words_to_wrap = {}
+    # Queue the translation indices of each word, in order, so each occurrence
+    # of a word takes the next one (duplicate words get their own translation)
+    words_to_wrap = defaultdict(deque)
     for i, t in enumerate(translations):
-        word = t["word"]
-        if word not in words_to_wrap:
-            words_to_wrap[word] = []
-        words_to_wrap[word].append(i)
-
-    # Track which occurrence of each word we've seen
-    word_occurrence_counter = {}
+        words_to_wrap[t["word"]].append(i)
 
-    # Split text into parts while preserving everything
-    result_parts = []
-    current_pos = 0
-
-    # Find all word boundaries
-    for match in re.finditer(r'\b(\w+)\b', text):
+    def wrap(match):
         word = match.group(0)
-        start = match.start()
-        end = match.end()
-
-        # Add text before this word
-        if start > current_pos:
-            result_parts.append(text[current_pos:start])
-
-        # Check if this word should be wrapped
-        if word in words_to_wrap:
-            # Track which occurrence of this word we're on
-            if word not in word_occurrence_counter:
-                word_occurrence_counter[word] = 0
-
-            # Get the translation index for this occurrence
-            occurrence_idx = word_occurrence_counter[word]
-            if occurrence_idx < len(words_to_wrap[word]):
-                translation_idx = words_to_wrap[word][occurrence_idx]
-                result_parts.append(f'<span class=\'word\' data-word-id=\'{translation_idx}\'>{word}</span>')
-                word_occurrence_counter[word] += 1
-            else:
-                # More occurrences in text than in translations list
-                result_parts.append(word)
-        else:
-            result_parts.append(word)
-
-        current_pos = end
+        translation_indices = words_to_wrap.get(word)
+        if not translation_indices:
+            # Not translated, or more occurrences in text than in translations list
+            return word
+        return f'<span class=\'word\' data-word-id=\'{translation_indices.popleft()}\'>{word}</span>'
 
-    # Add remaining text
-    if current_pos < len(text):
-        result_parts.append(text[current_pos:])
-
-    return ''.join(result_parts)
+    # Substitute every word in a single pass, text between words is kept as is
+    return _WORD_RE.sub(wrap, text)
 
 
 def translate_words_with_mistral(text, context="", episode_id="unknown"):
     """
     Translate difficult German words to French with grammatical information using Mistral API
     Processes text paragraph by paragraph and returns HTML with clickable spans
-    Returns a tuple: (html_with_clickable_words, word_translations_dict)
+    Returns a tuple: (html_with_clickable_words, word_translations_dict, complete), with
+    complete set to False if some paragraphs could not be translated
     """
     if not MISTRAL_API_KEY:
         print("  ⚠ Warning: MISTRAL_API_KEY not set. Skipping translations.")
-        return text, {}
+        return text, {}, False
+
+    # A manuscript already translated with the same inputs is reused as a whole
+    cache_file = get_translated_manuscript_cache_path(text, context, episode_id)
+    cached = load_translated_manuscript(cache_file)
+    if cached:
+        print("  ✓ Using cached translated manuscript")
+        html_with_clickable_words, word_translations = cached
+        return html_with_clickable_words, word_translations, True
 
     # Extract paragraphs from HTML while preserving structure
     # Split by common paragraph tags
-    parts = re.split(r'(<p>|</p>|<br\s*/?>|<strong>|</strong>)', text, flags=re.IGNORECASE)
+    parts = _PARAGRAPH_SPLIT_RE.split(text)
 
     if not parts:
-        return text, {}
+        return text, {}, True
 
-    # Get clean text for counting
-    clean_text = strip_html_tags(text)
-    total_words = len(re.findall(r'\b\w+\b', clean_text))
+    # Indices of the actual paragraphs, classified once: the split pattern has a
+    # single group, so separator tags are at odd indices and only even ones hold text
+    paragraph_indices = [
+        i for i in range(0, len(parts), 2)
+        if parts[i].strip() and not parts[i].startswith('<')
+    ]
 
-    # Extract actual paragraphs (non-tag parts with content)
-    paragraphs = [p.strip() for p in parts if p.strip() and not re.match(r'^<', p)]
+    paragraphs = [parts[i] for i in paragraph_indices]
+
+    # Count words for the progress message only, without building a stripped copy
+    total_words = sum(1 for paragraph in paragraphs for _ in _WORD_RE.finditer(paragraph))
 
     print(f"  Translating difficult words from {total_words} total words across {len(paragraphs)} paragraphs using Mistral API...")
 
+    # Cached paragraphs are resolved locally, the others are sent to the API in batches
+    # Each distinct paragraph is only looked up and translated once
+    translated_paragraphs = {}
+    to_translate = []
+    for part in dict.fromkeys(paragraphs):
+        num_difficult_words = count_difficult_words(part)
+        if not num_difficult_words:
+            continue
+        cached_result = get_cached_paragraph_translation(part, num_difficult_words, context)
+        if cached_result:
+            translated_paragraphs[part] = cached_result
+        else:
+            to_translate.append((part, num_difficult_words))
+
+    if translated_paragraphs:
+        print(f"    ✓ Using cached translations for {len(translated_paragraphs)} paragraphs")
+
+    batches = [
+        to_translate[i:i + MISTRAL_BATCH_SIZE]
+        for i in range(0, len(to_translate), MISTRAL_BATCH_SIZE)
+    ]
+
+    def translate(batch_num, batch):
+        print(f"    Processing batch {batch_num}/{len(batches)} ({len(batch)} paragraphs)...")
+        return translate_paragraphs_with_mistral(batch, context)
+
+    # Requests mostly wait on the API, so batches are translated concurrently in threads
+    with ThreadPoolExecutor(max_workers=MISTRAL_MAX_CONCURRENCY) as executor:
+        for batch_result in executor.map(translate, range(1, len(batches) + 1), batches):
+            translated_paragraphs.update(batch_result)
+
     all_word_translations = {}
     word_id_counter = 0
-    result_parts = []
 
-    for i, part in enumerate(parts):
-        # If it's an HTML tag or empty, keep as-is
-        if not part.strip() or re.match(r'^<', part):
-            result_parts.append(part)
+    # HTML tags and empty parts are kept as-is, paragraphs are replaced in place
+    for i in paragraph_indices:
+        # Get HTML with spans and translations for this paragraph
+        translations = translated_paragraphs.get(parts[i])
+        if not translations:
             continue
+        html_with_spans = wrap_words_in_spans(parts[i], translations)
 
-        para_num = sum(1 for p in parts[:i] if p.strip() and not re.match(r'^<', p)) + 1
-        print(f"    Processing paragraph {para_num}/{len(paragraphs)}...")
+        # Update word IDs to be unique per episode using DW lesson ID
+        new_ids = {}
+        for old_id, translation in enumerate(translations):
+            # Use DW lesson ID for word ID prefix
+            new_id = f"l{episode_id}_w{word_id_counter}"
+            new_ids[str(old_id)] = new_id
+
+            # Store translation with new ID
+            all_word_translations[new_id] = {
+                "word": translation.get("word", ""),
+                "grammar": translation.get("grammar", ""),
+                "translation": translation.get("translation", "")
+            }
+            word_id_counter += 1
+
+        # Replace every data-word-id in HTML in a single pass
+        html_with_spans = _WORD_ID_RE.sub(
+            lambda m: f"data-word-id={m.group(1)}{new_ids.get(m.group(2), m.group(2))}{m.group(1)}",
+            html_with_spans
+        )
 
-        # Get HTML with spans and translations for this paragraph
-        html_with_spans, translations = translate_paragraph_with_mistral(part, context)
+        parts[i] = html_with_spans
 
-        # Update word IDs to be unique per episode using DW lesson ID
-        if translations:
-            for translation in translations:
-                old_id = str(translations.index(translation))
-                # Use DW lesson ID for word ID prefix
-                new_id = f"l{episode_id}_w{word_id_counter}"
-
-                # Replace data-word-id in HTML
-                html_with_spans = html_with_spans.replace(f"data-word-id='{old_id}'", f"data-word-id='{new_id}'")
-                html_with_spans = html_with_spans.replace(f'data-word-id="{old_id}"', f'data-word-id="{new_id}"')
-
-                # Store translation with new ID
-                all_word_translations[new_id] = {
-                    "word": translation.get("word", ""),
-                    "grammar": translation.get("grammar", ""),
-                    "translation": translation.get("translation", "")
-                }
-                word_id_counter += 1
-
-        result_parts.append(html_with_spans)
-
-    final_html = ''.join(result_parts)
+    final_html = ''.join(parts)
     print(f"  ✓ Successfully translated {len(all_word_translations)} difficult words")
-    return final_html, all_word_translations
+
+    # Only complete results are cached, so failed paragraphs are retried on the next run
+    complete = all(part in translated_paragraphs for part, _ in to_translate)
+    if complete:
+        save_translated_manuscript(cache_file, final_html, all_word_translations)
+    return final_html, all_word_translations, complete
 
 
 def make_words_clickable(html_content, word_translations):
     """
     Process HTML content to make each word clickable
+    word_translations is a list indexed by word position, with None for words
+    without a translation
     Returns modified HTML with clickable words
     """
     if not word_translations:
         return html_content
 
     word_index = 0
+    result = []
 
-    def replace_text_content(text):
-        """Replace words in plain text (not in HTML tags)"""
-        nonlocal word_index
+    # Tags and whitespace are kept as-is; a run of text between them is made clickable
+    # if it is a word followed only by punctuation
+    for match in _CLICKABLE_TOKEN_RE.finditer(html_content):
+        word = match.group('word')
+        if word is None:
+            result.append(match.group(0))
+            continue
+        # Check if we have a translation for this word; every word takes a position,
+        # translated or not
+        if word_index < len(word_translations) and word_translations[word_index] is not None:
+            result.append(f'<span class="word" onclick="showTranslation(\'word_{word_index}\', event)">{word}</span>{match.group("punct")}')
+        else:
+            result.append(match.group(0))
+        word_index += 1
 
-        # Split text into words while preserving whitespace and punctuation
-        parts = re.split(r'(\s+)', text)
-        result_parts = []
+    return ''.join(result)
 
-        for part in parts:
-            # Check if this part is whitespace
-            if re.match(r'^\s+$', part):
-                result_parts.append(part)
+
+def iter_feed_items(chunks):
+    """
+    Incrementally parse an RSS document from an iterable of bytes chunks
+    Yields <item> elements as soon as they are complete
+    """
+    if LXML_AVAILABLE:
+        # lxml filters on the tag in C and only reports <item> events
+        parser = ET.XMLPullParser(events=('end',), tag='item')
+    else:
+        parser = ET.XMLPullParser(events=('end',))
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if elem.tag != 'item':
                 continue
+            yield elem
+            if LXML_AVAILABLE:
+                # Detach everything before this item (channel header,
+                # collected items) so the tree under construction
+                # stays small; detached items remain usable
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    parser.close()
 
-            # Extract words from this part (may have punctuation)
-            # Match word + optional punctuation
-            word_match = re.match(r'^(\w+)([\W]*)$', part)
-            if word_match:
-                word = word_match.group(1)
-                punct = word_match.group(2)
-
-                # Check if we have a translation for this word
-                if f"word_{word_index}" in word_translations:
-                    word_id = f"word_{word_index}"
-                    result_parts.append(f'<span class="word" onclick="showTranslation(\'{word_id}\', event)">{word}</span>{punct}')
-                    word_index += 1
-                else:
-                    result_parts.append(part)
-            else:
-                result_parts.append(part)
 
-        return ''.join(result_parts)
+def get_generator_hash():
+    """
+    Hash of the generator code and settings, so a page generated by a different
+    version of the generator is not considered up to date
+    """
+    with open(__file__, 'rb') as f:
+        source = f.read()
+    key = source + f"|{MAX_EPISODES}|{MISTRAL_MODEL}".encode('utf-8')
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
 
-    # Process HTML content - split by tags and process only text between tags
-    # This regex splits on HTML tags while keeping the tags
-    parts = re.split(r'(<[^>]+>)', html_content)
 
-    result = []
-    for part in parts:
-        # If it's an HTML tag, keep it as-is
-        if part.startswith('<') and part.endswith('>'):
-            result.append(part)
-        else:
-            # It's text content - make words clickable
-            result.append(replace_text_content(part))
+def load_feed_state():
+    """
+    Load the HTTP validators (ETag, Last-Modified) of the last processed feed
+    Validators saved by a different generator are ignored
+    """
+    try:
+        with open(FEED_STATE_FILE, 'r', encoding='utf-8') as f:
+            feed_state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if feed_state.get('generator') != get_generator_hash():
+        return {}
+    return feed_state
 
-    return ''.join(result)
 
+def save_feed_state(feed_state):
+    """Save the HTTP validators of the processed feed, with the generator hash, for the next run"""
+    try:
+        with open(FEED_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({**feed_state, 'generator': get_generator_hash()}, f)
+    except OSError as e:
+        print(f"  ⚠ Error saving feed state: {e}")
 
-def parse_feed():
-    """Parse RSS feed and extract episodes"""
-    print(f"Fetching RSS feed from {RSS_FEED_URL}...")
 
+def clear_feed_state():
+    """Remove the saved validators, so the next run requests the feed unconditionally"""
     try:
-        from urllib.request import Request
-        # Add User-Agent to avoid 403 errors
-        req = Request(RSS_FEED_URL, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(req) as response:
-            xml_data = response.read()
-    except Exception as e:
-        raise Exception(f"Failed to fetch RSS feed: {e}")
+        os.remove(FEED_STATE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"  ⚠ Error removing feed state: {e}")
 
+
+def parse_feed(feed_state=None):
+    """
+    Parse RSS feed and extract episodes
+    If feed_state holds validators from a previous run, the request is conditional
+    Returns a tuple: (items, feed_state), with items set to None if the feed was not modified
+    """
+    print(f"Fetching RSS feed from {RSS_FEED_URL}...")
+
+    headers = {}
+    if feed_state:
+        if feed_state.get('etag'):
+            headers['If-None-Match'] = feed_state['etag']
+        if feed_state.get('last_modified'):
+            headers['If-Modified-Since'] = feed_state['last_modified']
+
+    # Stream-parse the feed while it downloads and stop once MAX_EPISODES
+    # items are collected, as only those are rendered. The parser is fed raw
+    # bytes and decodes them itself according to the XML declaration: never
+    # decode the body in Python first (lxml rejects str input that carries an
+    # encoding declaration)
+    items = []
     try:
-        root = ET.fromstring(xml_data)
+        with HTTP_CLIENT.stream('GET', RSS_FEED_URL, headers=headers) as response:
+            if response.status_code == 304:
+                print("Feed not modified since last run")
+                return None, feed_state
+            response.raise_for_status()
+            feed_state = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+            for item in iter_feed_items(response.iter_bytes()):
+                items.append(item)
+                if len(items) >= MAX_EPISODES:
+                    break
+    except httpx.HTTPError as e:
+        raise Exception(f"Failed to fetch RSS feed: {e}")
     except ET.ParseError as e:
         raise Exception(f"Failed to parse RSS feed XML: {e}")
 
-    # Find all item elements
-    # RSS feeds use the 'item' tag within 'channel'
-    items = root.findall('.//item')
-
     if not items:
         raise Exception("No episodes found in RSS feed")
 
-    print(f"Found {len(items)} episodes in feed")
-    return items
+    print(f"Parsed {len(items)} episodes from feed")
+    return items, feed_state
 
 
 def get_element_text(element, tag, default=''):
     """Safely extract text from XML element"""
-    child = element.find(tag)
-    if child is not None and child.text:
-        return child.text
-    # Try with namespace for iTunes tags
-    if 'itunes:' in tag:
-        ns_tag = tag.replace('itunes:', '{http://www.itunes.com/dtds/podcast-1.0.dtd}')
-        child = element.find(ns_tag)
-        if child is not None and child.text:
-            return child.text
-    return default
+    xpath = _TEXT_XPATHS.get(tag)
+    if xpath is not None:
+        text = xpath(element)
+    else:
+        text = element.findtext(_RESOLVED_TAGS.get(tag, tag))
+    return text if text else default
+
+
+def get_enclosure_url(element):
+    """Extract the audio URL from the enclosure of an RSS item"""
+    if LXML_AVAILABLE:
+        return _ENCLOSURE_URL_XPATH(element)
+    enclosure = element.find('enclosure')
+    if enclosure is not None:
+        return enclosure.get('url', '')
+    return ''
 
 
 def get_episode_id(episode_link):
@@ -1049,8 +1417,7 @@ def get_episode_id(episode_link):
         return None
 
     # Extract the lesson ID (format: l-XXXXXXXX)
-    import re
-    match = re.search(r'/l-(\d+)', episode_link)
+    match = _LESSON_ID_RE.search(episode_link)
     if match:
         return match.group(1)
     return None
@@ -1074,9 +1441,77 @@ def get_manuscript_url(episode_link):
     return manuscript_url
 
 
-def fetch_manuscript(manuscript_url, episode_number):
+def get_illustration_url(style):
+    """Extract the absolute illustration URL from a poster-container style attribute"""
+    if not style:
+        return None
+    # Extract URL from background-image: url("...")
+    match = _BACKGROUND_URL_RE.search(style)
+    if not match:
+        return None
+    illustration_url = match.group(1)
+    # Make sure it's an absolute URL
+    if illustration_url.startswith('//'):
+        illustration_url = 'https:' + illustration_url
+    elif illustration_url.startswith('/'):
+        illustration_url = 'https://learngerman.dw.com' + illustration_url
+    return illustration_url
+
+
+def inner_html(element):
+    """Serialize the content of an lxml element, like the DOM innerHTML property"""
+    content = escape_html(element.text or '', quote=False) + ''.join(
+        lxml_html.tostring(child, encoding='unicode') for child in element)
+    # The DOM serializes non-breaking spaces as &nbsp;, keep the same text (and
+    # translation cache keys) as manuscripts fetched in the browser
+    return content.replace('\xa0', '&nbsp;')
+
+
+def fetch_manuscript_static(manuscript_url, episode_number):
+    """
+    Fetch manuscript content and illustration URL from the HTML served by the DW website,
+    without a browser
+    Returns a tuple: (manuscript_html, illustration_url) or None if the page has to be
+    rendered by Playwright
+    """
+    if not LXML_AVAILABLE:
+        return None
+
+    try:
+        response = HTTP_CLIENT.get(manuscript_url)
+        response.raise_for_status()
+        document = lxml_html.fromstring(response.text)
+    except Exception as e:
+        print(f"  ⚠ Could not fetch static manuscript page: {e}")
+        return None
+
+    for section in _MANUSCRIPT_SECTIONS_XPATH(document):
+        manuscript_html = inner_html(section)
+        if len(manuscript_html.strip()) > 100:
+            break
+    else:
+        return None
+
+    illustration_url = get_illustration_url(_POSTER_STYLE_XPATH(document))
+    if illustration_url:
+        print(f"  ✓ Found illustration: {illustration_url}")
+    print(f"  ✓ Successfully fetched manuscript for episode {episode_number} without a browser")
+    return manuscript_html, illustration_url
+
+
+async def block_unneeded_resources(route):
+    """Abort requests for resources that are not needed to read the manuscript"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_manuscript(context, manuscript_url, episode_number):
     """
     Fetch manuscript content and illustration URL from the DW website using Playwright
+    The page is opened in the shared browser context, so Chromium is launched only once per run
     Returns a tuple: (manuscript_html, illustration_url) or (None, None) if not found
     """
     if not manuscript_url:
@@ -1085,58 +1520,38 @@ def fetch_manuscript(manuscript_url, episode_number):
     print(f"  Fetching manuscript from {manuscript_url}...")
 
     try:
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
+        page = await context.new_page()
+        try:
             # Navigate to the manuscript page
-            page.goto(manuscript_url, wait_until='networkidle', timeout=30000)
+            await page.goto(manuscript_url, wait_until='domcontentloaded', timeout=30000)
 
-            # Wait for the page to load and JavaScript to render
-            page.wait_for_timeout(2000)
+            # Proceed as soon as the rendered content is present
+            await page.wait_for_selector('div.richtext-content-container', state='attached', timeout=15000)
 
             # Find the div containing "Manuskript"
             # Then find the next richtext-content-container div
             try:
-                # Look for the section with Manuskript heading
-                manuscript_section = page.locator('div.richtext-content-container').all()
-
-                manuscript_html = None
-                for section in manuscript_section:
-                    # Get the HTML content
-                    content = section.inner_html()
-                    # Check if this section appears after "Manuskript" heading
-                    # We'll take the content if it looks substantial
-                    if content and len(content.strip()) > 100:
-                        manuscript_html = content
-                        break
-
-                # Fetch illustration URL - look for the poster-container with background-image
-                illustration_url = None
-                try:
-                    # Look for the poster-container div with background-image
-                    poster_container = page.locator('[data-testid="poster-container"]').first
-                    if poster_container:
-                        style = poster_container.get_attribute('style')
-                        if style:
-                            # Extract URL from background-image: url("...")
-                            import re
-                            match = re.search(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)', style)
-                            if match:
-                                illustration_url = match.group(1)
-                                # Make sure it's an absolute URL
-                                if illustration_url.startswith('//'):
-                                    illustration_url = 'https:' + illustration_url
-                                elif illustration_url.startswith('/'):
-                                    illustration_url = 'https://learngerman.dw.com' + illustration_url
-
-                    if illustration_url:
-                        print(f"  ✓ Found illustration: {illustration_url}")
-                except Exception as e:
-                    print(f"  ⚠ Could not fetch illustration: {e}")
-
-                browser.close()
+                # Pick the first substantial section and read the poster style in the
+                # page itself, so only what is needed crosses the browser boundary,
+                # in one round-trip
+                data = await page.evaluate("""() => {
+                    let html = null;
+                    for (const section of document.querySelectorAll('div.richtext-content-container')) {
+                        const content = section.innerHTML;
+                        if (content && content.trim().length > 100) {
+                            html = content;
+                            break;
+                        }
+                    }
+                    const poster = document.querySelector('[data-testid="poster-container"]');
+                    return {html, style: poster ? poster.getAttribute('style') : null};
+                }""")
+                manuscript_html = data['html']
+
+                # Illustration URL from the poster-container background-image
+                illustration_url = get_illustration_url(data['style'])
+                if illustration_url:
+                    print(f"  ✓ Found illustration: {illustration_url}")
 
                 if manuscript_html:
                     print(f"  ✓ Successfully fetched manuscript for episode {episode_number}")
@@ -1147,62 +1562,233 @@ def fetch_manuscript(manuscript_url, episode_number):
 
             except Exception as e:
                 print(f"  ✗ Error finding manuscript content: {e}")
-                browser.close()
                 return None, None
+        finally:
+            await page.close()
 
     except Exception as e:
         print(f"  ✗ Error fetching manuscript: {e}")
         return None, None
 
 
-def generate_episode_html(item, number, fetch_manuscripts=True, word_translations_dict=None):
+async def fetch_manuscripts_async(manuscript_requests):
+    """
+    Fetch several manuscripts concurrently in one browser and context
+    manuscript_requests is a list of (episode_number, manuscript_url) pairs
+    At most MAX_CONCURRENT_FETCHES pages are loaded at the same time
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            context = await browser.new_context(viewport={'width': 1024, 'height': 600})
+            await context.route("**/*", block_unneeded_resources)
+
+            async def fetch(number, manuscript_url):
+                async with semaphore:
+                    return await fetch_manuscript(context, manuscript_url, number)
+
+            return await asyncio.gather(*(
+                fetch(number, manuscript_url)
+                for number, manuscript_url in manuscript_requests
+            ))
+        finally:
+            await browser.close()
+
+
+def get_manuscript_cache_path(manuscript_url):
+    """Path of the on-disk cache entry for a manuscript URL"""
+    key = hashlib.sha1(manuscript_url.encode('utf-8')).hexdigest()
+    return os.path.join(MANUSCRIPTS_DIR, f"{key}.json")
+
+
+def load_cached_manuscript(manuscript_url):
+    """
+    Retrieve a previously fetched manuscript from the on-disk cache
+    Returns a tuple: (manuscript_html, illustration_url) or None if not cached
+    """
+    cache_file = get_manuscript_cache_path(manuscript_url)
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            data = json_loads(f.read())
+        return data['manuscript_html'], data.get('illustration_url')
+    except Exception as e:
+        print(f"  ⚠ Error loading cached manuscript: {e}")
+        return None
+
+
+def save_cached_manuscript(manuscript_url, manuscript_html, illustration_url):
+    """Save a fetched manuscript to the on-disk cache, atomically"""
+    os.makedirs(MANUSCRIPTS_DIR, exist_ok=True)
+    cache_file = get_manuscript_cache_path(manuscript_url)
+    tmp_file = f"{cache_file}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(json_dumps({
+                'manuscript_url': manuscript_url,
+                'manuscript_html': manuscript_html,
+                'illustration_url': illustration_url,
+            }))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"  ⚠ Error saving cached manuscript: {e}")
+
+
+def get_translated_manuscript_cache_path(manuscript_html, context, episode_id):
+    """
+    Path of the on-disk cache entry for a translated manuscript
+    The key covers every input of the translation, including the model
+    """
+    key = hashlib.blake2b(
+        f"{manuscript_html}|{context}|{episode_id}|{MISTRAL_MODEL}|{MIN_PARAGRAPH_WORDS}".encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+    return os.path.join(MANUSCRIPTS_DIR, f"translated-{key}.json")
+
+
+def load_translated_manuscript(cache_file):
+    """
+    Retrieve a previously translated manuscript from the on-disk cache
+    Returns a tuple: (html_with_clickable_words, word_translations_dict) or None if not cached
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            data = json_loads(f.read())
+        return data['html'], data['word_translations']
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"  ⚠ Error loading cached translated manuscript: {e}")
+        return None
+
+
+def save_translated_manuscript(cache_file, html, word_translations):
+    """Save a translated manuscript to the on-disk cache, atomically"""
+    os.makedirs(MANUSCRIPTS_DIR, exist_ok=True)
+    tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(json_dumps({
+                'html': html,
+                'word_translations': word_translations,
+            }))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"  ⚠ Error saving cached translated manuscript: {e}")
+
+
+def fetch_manuscripts(manuscript_urls, refresh=False):
+    """
+    Fetch the manuscripts of several episodes, concurrently
+    Manuscripts found in the on-disk cache are not fetched again unless refresh is set.
+    Pages are first read over plain HTTP, and the browser is only launched for the
+    manuscripts that could not be extracted that way
+    Returns a list of (manuscript_html, illustration_url) tuples, in the order of manuscript_urls
+    """
+    results = [(None, None)] * len(manuscript_urls)
+    uncached = []
+    for index, manuscript_url in enumerate(manuscript_urls):
+        if not manuscript_url:
+            continue
+        cached = None if refresh else load_cached_manuscript(manuscript_url)
+        if cached:
+            print(f"  ✓ Using cached manuscript for episode {index + 1}")
+            results[index] = cached
+        else:
+            uncached.append(index)
+
+    # Plain HTTP requests are network-bound, so they run in threads sharing HTTP_CLIENT
+    to_fetch = []
+    if uncached:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STATIC_FETCHES) as executor:
+            fetched = list(executor.map(
+                lambda index: fetch_manuscript_static(manuscript_urls[index], index + 1),
+                uncached
+            ))
+        for index, static_result in zip(uncached, fetched):
+            if static_result:
+                results[index] = static_result
+                save_cached_manuscript(manuscript_urls[index], *static_result)
+            else:
+                to_fetch.append(index)
+
+    if to_fetch:
+        try:
+            fetched = asyncio.run(fetch_manuscripts_async([
+                (index + 1, manuscript_urls[index]) for index in to_fetch
+            ]))
+        except Exception as e:
+            # The browser could not be started: build the page without these manuscripts
+            print(f"  ✗ Error fetching manuscript: {e}")
+            fetched = [(None, None)] * len(to_fetch)
+        for index, (manuscript_html, illustration_url) in zip(to_fetch, fetched):
+            results[index] = (manuscript_html, illustration_url)
+            if manuscript_html:
+                save_cached_manuscript(manuscript_urls[index], manuscript_html, illustration_url)
+
+    return results
+
+
+def generate_episode_html(item, number, manuscript=None, word_translations_dict=None):
     """
     Generate HTML for a single episode from XML item
-    Returns a tuple: (episode_card_html, episode_detail_html)
+    manuscript is the (manuscript_html, illustration_url) tuple fetched for the episode, if any
+    Translates the manuscript, then renders the episode with build_episode_html
+    Returns a tuple: (episode_card_html, episode_detail_html, translated), with translated
+    set to False if the manuscript could not be fully translated
     """
+    print(f"\nProcessing episode {number}...")
     if word_translations_dict is None:
         word_translations_dict = {}
 
+    # Use the fetched manuscript, if any
+    manuscript_content, illustration_url = manuscript or (None, None)
+    translated = True
+    if manuscript_content:
+        # Extract DW lesson ID from the episode link
+        link = get_element_text(item, 'link', '#')
+        episode_id = get_episode_id(link) or str(number)  # fallback to number if ID not found
+
+        # Translate difficult words in the manuscript and get HTML with clickable spans
+        title_text = get_element_text(item, 'title', 'Untitled')
+        manuscript_content, word_translations, translated = translate_words_with_mistral(manuscript_content, context=title_text, episode_id=episode_id)
+
+        # Store translations for this episode
+        if word_translations:
+            word_translations_dict[f"episode_{number}"] = word_translations
+
+    episode_card, episode_detail = build_episode_html(item, number, manuscript_content, illustration_url)
+    return episode_card, episode_detail, translated
+
+
+def build_episode_html(item, number, manuscript_content=None, illustration_url=None):
+    """
+    Render a single episode from XML item, without any network access
+    manuscript_content is the manuscript HTML, already translated, if any
+    Returns a tuple: (episode_card_html, episode_detail_html)
+    """
     # Extract title
     title_text = get_element_text(item, 'title', 'Untitled')
-    title = html.escape(title_text)
+    title = escape_html(title_text)
 
     # Extract and format date
-    date_str = "Datum unbekannt"
     pub_date = get_element_text(item, 'pubDate', '')
-    if pub_date:
-        try:
-            # Parse RFC 822 date format (e.g., "Mon, 15 Jan 2024 12:00:00 +0000")
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(pub_date)
-            # Format to German date
-            months_de = ['', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
-                        'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember']
-            date_str = f"{dt.day}. {months_de[dt.month]} {dt.year}"
-        except:
-            date_str = pub_date
+    date_str = format_pub_date(pub_date) if pub_date else "Datum unbekannt"
 
     # Extract description/summary
-    description_text = get_element_text(item, 'description',
-                                       get_element_text(item, 'itunes:summary',
-                                                       'Keine Beschreibung verfügbar.'))
+    description_text = get_element_text(item, 'description')
+    if not description_text:
+        description_text = get_element_text(item, 'itunes:summary', 'Keine Beschreibung verfügbar.')
     # Clean HTML tags from description
-    description = strip_html_tags(description_text)
-    description = html.escape(description)
-
     # Keep full description for detail view, but limit for card view
-    description_short = description
-    if len(description) > 150:
-        description_short = description[:147] + "..."
-
-    # Extract link
-    link = get_element_text(item, 'link', '#')
+    description = clean_description(description_text)
+    description_short = clean_description(description_text, limit=150)
 
     # Extract audio enclosure
-    audio_url = ""
-    enclosure = item.find('enclosure')
-    if enclosure is not None:
-        audio_url = enclosure.get('url', '')
+    audio_url = get_enclosure_url(item)
 
     # Extract duration
     duration_html = ""
@@ -1212,115 +1798,139 @@ def generate_episode_html(item, number, fetch_manuscripts=True, word_translation
         if formatted_duration:
             duration_html = f' • {formatted_duration}'
 
-    # Fetch manuscript if enabled
+    # Generate transcript section
     transcript_section = ""
-    illustration_html = ""
-    illustration_card_html = ""
-    if fetch_manuscripts:
-        manuscript_url = get_manuscript_url(link)
-        if manuscript_url:
-            manuscript_content, illustration_url = fetch_manuscript(manuscript_url, number)
-            if manuscript_content:
-                # Extract DW lesson ID from the episode link
-                episode_id = get_episode_id(link) or str(number)  # fallback to number if ID not found
-
-                # Translate difficult words in the manuscript and get HTML with clickable spans
-                manuscript_content, word_translations = translate_words_with_mistral(manuscript_content, context=title_text, episode_id=episode_id)
-
-                # Store translations for this episode
-                if word_translations:
-                    word_translations_dict[f"episode_{number}"] = word_translations
-
-                # Generate transcript section
-                transcript_section = TRANSCRIPT_SECTION_TEMPLATE.format(
-                    number=number,
-                    manuscript_content=manuscript_content
-                )
-
-            # Generate illustration HTML if URL was found
-            if illustration_url:
-                # Full size for detail view
-                illustration_html = f'<img src="{illustration_url}" alt="{title}" class="episode-illustration" style="width: 100%; border-radius: 10px; margin-bottom: 1.5rem;">'
-                # Smaller version for card view
-                illustration_card_html = f'<img src="{illustration_url}" alt="{title}" class="episode-illustration-card" style="width: 100%; border-radius: 8px; margin-bottom: 0.75rem;">'
+    if manuscript_content:
+        transcript_section = render_transcript_section(
+            number=number,
+            manuscript_content=manuscript_content
+        )
 
     # Generate episode card (for list view)
-    episode_card = EPISODE_CARD_TEMPLATE.format(
+    episode_card = render_episode_card(
         number=number,
         date=date_str,
         title=title,
         description=description_short,
-        illustration=illustration_card_html
+        illustration_url=illustration_url
     )
 
     # Generate episode detail (for detail view)
-    episode_detail = EPISODE_DETAIL_TEMPLATE.format(
+    episode_detail = render_episode_detail(
         number=number,
         title=title,
         date=date_str,
         duration=duration_html,
         audio_url=audio_url if audio_url else "",
         description=description,
-        illustration=illustration_html,
+        illustration_url=illustration_url,
         transcript_section=transcript_section
     )
 
     return episode_card, episode_detail
 
 
-def generate_html(items):
-    """Generate complete HTML page from XML items"""
-    episode_cards = []
-    episode_details = []
+def iter_joined(separator, parts):
+    """Yield parts with separator between them, like separator.join(parts) without building the string"""
+    for i, part in enumerate(parts):
+        if i:
+            yield separator
+        yield part
+
+
+def generate_html(items, out, refresh=False):
+    """
+    Generate complete HTML page from XML items and write it to the out file object
+    If refresh is set, cached manuscripts are ignored and fetched again
+    Returns True if every manuscript was fetched and fully translated
+    """
     all_word_translations = {}
 
     # Get the first MAX_EPISODES items
     items_to_process = items[:MAX_EPISODES]
 
+    # Fetch manuscripts for all episodes concurrently
+    print("\nFetching manuscripts...")
+    manuscript_urls = [
+        get_manuscript_url(get_element_text(item, 'link', '#'))
+        for item in items_to_process
+    ]
+    manuscripts = fetch_manuscripts(manuscript_urls, refresh=refresh)
+
     print("\nGenerating HTML for episodes...")
-    for i, item in enumerate(items_to_process, 1):
-        print(f"\nProcessing episode {i}...")
-        # Fetch manuscript for all episodes
-        fetch_manuscripts = True
-        episode_card, episode_detail = generate_episode_html(
-            item, i,
-            fetch_manuscripts=fetch_manuscripts,
-            word_translations_dict=all_word_translations
-        )
-        episode_cards.append(episode_card)
-        episode_details.append(episode_detail)
 
-    # Merge all word translations into a single dictionary
-    merged_translations = {}
-    for episode_key, translations in all_word_translations.items():
-        merged_translations.update(translations)
+    def render(number, item, manuscript):
+        return generate_episode_html(item, number, manuscript=manuscript, word_translations_dict=all_word_translations)
 
-    # Convert translations to JSON
-    word_translations_json = json.dumps(merged_translations, ensure_ascii=False)
+    # Episodes are rendered concurrently, as their translation mostly waits on the API
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_EPISODES) as executor:
+        rendered = list(executor.map(
+            render, range(1, len(items_to_process) + 1), items_to_process, manuscripts
+        ))
+    episode_cards = [episode_card for episode_card, _, _ in rendered]
+    episode_details = [episode_detail for _, episode_detail, _ in rendered]
 
-    # Generate final HTML
-    html_content = HTML_TEMPLATE.format(
-        episodes="\n".join(episode_cards),
-        episode_details="\n".join(episode_details),
-        word_translations_data=word_translations_json
+    # Merge all word translations into a single dictionary, in episode order
+    # (episodes may have completed in any order)
+    merged_translations = {}
+    for number in range(1, len(items_to_process) + 1):
+        merged_translations.update(all_word_translations.get(f"episode_{number}", {}))
+
+    # Convert translations to JSON (compact with orjson, which also encodes it much faster)
+    word_translations_json = json_dumps(merged_translations).decode('utf-8')
+
+    # Write the page chunk by chunk instead of assembling it in memory first
+    out.writelines([_PAGE_HEAD, word_translations_json, _PAGE_BEFORE_EPISODES])
+    out.writelines(iter_joined("\n", episode_cards))
+    out.write(_PAGE_BEFORE_DETAILS)
+    out.writelines(iter_joined("\n", episode_details))
+    out.write(_PAGE_TAIL)
+
+    # Episodes without a manuscript page have nothing to fetch
+    return all(
+        translated and (manuscript_html or not manuscript_url)
+        for manuscript_url, (manuscript_html, _), (_, _, translated)
+        in zip(manuscript_urls, manuscripts, rendered)
     )
 
-    return html_content
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate index.html from the DW Alltagsdeutsch RSS feed")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore cached manuscripts and fetch them again")
+    parser.add_argument('--force', action='store_true',
+                        help="regenerate the page even if the feed was not modified")
+    return parser.parse_args()
 
 
 def main():
     """Main function"""
+    args = parse_args()
     try:
-        # Parse feed
-        items = parse_feed()
-
-        # Generate HTML
-        html_content = generate_html(items)
+        # Parse feed, skipping the run if it did not change since the page was
+        # last generated
+        force = args.force or args.refresh or not os.path.exists(OUTPUT_FILE)
+        items, feed_state = parse_feed(None if force else load_feed_state())
+        if items is None:
+            print(f"✓ {OUTPUT_FILE} is up to date")
+            return
+
+        # Generate HTML into a temporary file so a failed run leaves the
+        # previous page untouched
+        tmp_file = f"{OUTPUT_FILE}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            complete = generate_html(items, f, refresh=args.refresh)
 
-        # Write to file
         print(f"Writing HTML to {OUTPUT_FILE}...")
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        os.replace(tmp_file, OUTPUT_FILE)
+        # A page missing manuscripts or translations is regenerated on the next
+        # run, even if the feed did not change
+        if complete:
+            save_feed_state(feed_state)
+        else:
+            print("  ⚠ Some manuscripts are missing or not fully translated, the page will be regenerated on the next run")
+            clear_feed_state()
 
         print(f"✓ Successfully generated {OUTPUT_FILE} with {min(len(items), MAX_EPISODES)} episodes")
 